@@ -5,6 +5,11 @@ To make use of this module, you simply import the :func:`expect`
 starter into your spec/test file, and specify the expectation
 you have about two values.
 """
+from itertools import islice
+try:
+    from reprlib import Repr
+except ImportError:  # Python 2
+    from repr import Repr
 
 
 # Core API
@@ -35,7 +40,15 @@ class Expr(object):
 
         >>> Expr(4 == 7).value == False
         True
+
+    An expectation is created for every single assertion, so instances are
+    kept lean with `__slots__` -- there is no per-instance `__dict__`::
+
+        >>> hasattr(Expr('Foo'), '__dict__')
+        False
     """
+    __slots__ = ('_determinant', 'value', 'args', 'kwargs')
+
     def __init__(self, expr, *args, **kwargs):
         self._determinant = True
         self.value = expr
@@ -88,7 +101,7 @@ class UnmetExpectation(AssertionError):
     To learn how to get the most out of your unmet expectations,
     see :doc:`usage/managing-expectations`
     """
-    pass
+    __slots__ = ()
 
 
 # provide a usable alias for the Expr class
@@ -160,18 +173,47 @@ def matcher(obj):
         Traceback (most recent call last):
             ...
         AssertionError: Expected 'foo' to equal 'BAR'
+
+    Matchers should be registered at import time, before any expectations
+    are evaluated. Every change to the :class:`Expr` class invalidates the
+    interpreter's attribute caches for it, so registering the same matcher
+    again leaves the class untouched::
+
+        >>> matcher(to_equal)
+        >>> expect.__dict__['to_equal'] is to_equal
+        True
     """
-    setattr(expect, obj.__name__, obj)
+    name = obj.__name__
+    if expect.__dict__.get(name) is not obj:
+        setattr(expect, name, obj)
 
 
-def ensure(expr, outcome, message=""):
+_MATCHERS = {}
+"""Maps the name of every built-in matcher to its callable, until :func:`_install` attaches them."""
+
+
+def _register(obj):
+    """Records a built-in matcher so it can be attached in one go by :func:`_install`."""
+    _MATCHERS[obj.__name__] = obj
+    return obj
+
+
+def _install(cls, matchers):
+    """Attaches all the given *matchers* to *cls* at once, once the module has loaded."""
+    for name, obj in matchers.items():
+        setattr(cls, name, obj)
+    return cls
+
+
+def ensure(expr, outcome=True, message=""):
     """Compares the result of the given boolean expression to the anticipated
     boolean outcome.
 
-    All the the default matchers delegate to the trusty `ensure` helper to handle
-    the actual determination of pass/fail for a given comparison. If there is a match,
-    all is well. If the comparison fails, it raises an UnmetExpectation error with
-    the given message.
+    The trusty `ensure` helper handles the actual determination of pass/fail for
+    a given comparison in custom matchers. If there is a match, all is well. If the
+    comparison fails, it raises an UnmetExpectation error with the given message.
+    The default matchers perform the same check inline, saving a function call
+    on every expectation.
 
     Stays quite if the comparison lines up::
 
@@ -193,15 +235,90 @@ def ensure(expr, outcome, message=""):
         Traceback (most recent call last):
             ...
         UnmetExpectation: 'Foo' does not equal 'foo'
+
+    The anticipated outcome defaults to True::
+
+        >>> ensure(5 == 5)
+
+    Formatting a message can be costly, and it is wasted whenever the comparison
+    lines up. The message may therefore be a callable, which is only invoked to
+    produce the message once the comparison fails::
+
+        >>> ensure(A == B, True, lambda: "%r does not equal %r" % (A, B))
+        Traceback (most recent call last):
+            ...
+        UnmetExpectation: 'Foo' does not equal 'foo'
     """
     if expr != outcome:
+        if callable(message):
+            message = message()
         raise UnmetExpectation(message)
 
 
 # Base Matchers
 # =============
 
-@matcher
+class _Repr(Repr):
+
+    """Repr that lists the keys of a dict in their own order, as repr() does,
+    rather than sorting them.
+    """
+
+    def repr_dict(self, x, level):
+        if not x:
+            return '{}'
+        if level <= 0:
+            return '{...}'
+        repr1 = self.repr1
+        pieces = ['%s: %s' % (repr1(key, level - 1), repr1(x[key], level - 1)) for key in islice(x, self.maxdict)]
+        if len(x) > self.maxdict:
+            pieces.append('...')
+        return '{%s}' % ', '.join(pieces)
+
+
+_repr = _Repr()
+_repr.maxstring = _repr.maxother = _repr.maxlong = 200
+_repr.maxlist = _repr.maxtuple = _repr.maxdict = _repr.maxset = _repr.maxfrozenset = _repr.maxdeque = 20
+_r = _repr.repr
+"""Size-capped repr() used in failure messages, so that a huge container does not
+make a failing expectation slow or its message unreadable. The items of a set
+are listed in sorted order.
+"""
+
+
+_NEGATE = ("not ", "")
+"""Wording for a negated and a regular expectation, indexed by the determinant."""
+
+
+def _unmet(context, phrase, hint=None, fail_message=None, expected=None, **fields):
+    """Creates the error for a failed matcher, so that every matcher words its
+    failure message the same way. It is only called once an expectation has
+    failed; a passing matcher returns before getting here.
+
+    *phrase* describes the expectation, e.g. ``"to equal %(expected)s"``. The
+    message gains a "not" when the expectation was negated, names the *hint*
+    when one is given, and is replaced outright by *fail_message*. Any extra
+    *fields* are made available to the phrase and to *fail_message*; an
+    ``actual`` field stands in for the wrapped `value`.
+
+    The stock messages show the values through the size-capped :func:`_r`. A
+    *fail_message* gets the values themselves, so that its own ``%(actual)r``
+    or ``%(actual)s`` placeholders render them as it asks.
+    """
+    actual = fields.pop('actual', context.value)
+    if fail_message:
+        fields.update(actual=actual, expected=expected)
+    else:
+        if hint:
+            fail_message = "Expected %(hint)s %(negate)s" + phrase + " but got %(actual)s"
+        else:
+            fail_message = "Expected %(actual)s %(negate)s" + phrase
+        fields.update(actual=_r(actual), expected=_r(expected))
+    fields.update(hint=hint, negate=_NEGATE[context._determinant])
+    return UnmetExpectation(fail_message % fields)
+
+
+@_register
 def to_equal(context, other, hint=None, fail_message=None):
     """Checks if `value == other` -- simple equality.
 
@@ -212,6 +329,12 @@ def to_equal(context, other, hint=None, fail_message=None):
 
         >>> expect(555).to_equal(555)
 
+    Like Python's own containers, an object is always considered equal to itself,
+    so identical values pass without calling `__eq__` at all::
+
+        >>> nan = float('nan')
+        >>> expect(nan).to_equal(nan)
+
     Fails if the values are not equal::
 
         >>> expect('waiting...').to_equal('done!')
@@ -227,6 +350,20 @@ def to_equal(context, other, hint=None, fail_message=None):
             ...
         UnmetExpectation: Expected status to equal 'done!' but got 'waiting...'
 
+    Large values are abbreviated in the failure message::
+
+        >>> expect([0] * 100).to_equal([])
+        Traceback (most recent call last):
+            ...
+        UnmetExpectation: Expected [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, ...] to equal []
+
+    Dicts are shown with their keys in their own order, as repr() would::
+
+        >>> expect({'y': 1, 'x': 2}).to_equal({})
+        Traceback (most recent call last):
+            ...
+        UnmetExpectation: Expected {'y': 1, 'x': 2} to equal {}
+
     Sometimes you may find it necessary to completely override the failure message::
 
         >>> status = 'waiting...'
@@ -235,6 +372,13 @@ def to_equal(context, other, hint=None, fail_message=None):
             ...
         UnmetExpectation: OMGWTFBBQ!?! Should be done by now.
 
+    The message may refer to the values by name::
+
+        >>> expect(status).to_equal('done!', fail_message='Still %(actual)s, not %(expected)r')
+        Traceback (most recent call last):
+            ...
+        UnmetExpectation: Still waiting..., not 'done!'
+
     Supports negation via the `NOT` operator::
 
         >>> expect('waiting...').NOT.to_equal('done!')
@@ -249,17 +393,13 @@ def to_equal(context, other, hint=None, fail_message=None):
         UnmetExpectation: Expected status not to equal 'waiting...' but got 'waiting...'
 
     """
-    if not fail_message:
-        if hint:
-            fail_message = "Expected %(hint)s %(negate)sto equal %(expected)r but got %(actual)r"
-        else:
-            fail_message = "Expected %(actual)r %(negate)sto equal %(expected)r"
-    negate = "" if context._determinant else "not "
-    message = fail_message % {'actual': context.value, 'expected': other, 'hint': hint, 'negate': negate}
-    ensure(context.value == other, context._determinant, message)
+    value = context.value
+    if (value is other or value == other) == context._determinant:
+        return
+    raise _unmet(context, "to equal %(expected)s", hint, fail_message, other)
 
 
-@matcher
+@_register
 def to_be(context, other, hint=None, fail_message=None):
     """Checks if `value is other` -- identity, id().
 
@@ -289,17 +429,12 @@ def to_be(context, other, hint=None, fail_message=None):
             ...
         UnmetExpectation: Expected a1 not to be ['foo', 'bar'] but got ['foo', 'bar']
     """
-    if not fail_message:
-        if hint:
-            fail_message = "Expected %(hint)s %(negate)sto be %(expected)r but got %(actual)r"
-        else:
-            fail_message = "Expected %(actual)r %(negate)sto be %(expected)r"
-    negate = "" if context._determinant else "not "
-    message = fail_message % {'actual': context.value, 'expected': other, 'hint': hint, 'negate': negate}
-    ensure(context.value is other, context._determinant, message)
+    if (context.value is other) is context._determinant:
+        return
+    raise _unmet(context, "to be %(expected)s", hint, fail_message, other)
 
 
-@matcher
+@_register
 def to_be_less_than(context, other, hint=None, fail_message=None):
     """Checks if `value < other`.
 
@@ -318,17 +453,21 @@ def to_be_less_than(context, other, hint=None, fail_message=None):
         Traceback (most recent call last):
             ...
         UnmetExpectation: Expected 9 to be less than 9
+
+    Supports negation via the `NOT` operator::
+
+        >>> expect(9).NOT.to_be_less_than(5)
+        >>> expect(9).NOT.to_be_less_than(10)
+        Traceback (most recent call last):
+            ...
+        UnmetExpectation: Expected 9 not to be less than 10
     """
-    if not fail_message:
-        if hint:
-            fail_message = "Expected %(hint)s to be less than %(expected)r but got %(actual)r"
-        else:
-            fail_message = "Expected %(actual)r to be less than %(expected)r"
-    message = fail_message % {'actual': context.value, 'expected': other, 'hint': hint}
-    ensure(context.value < other, True, message)
+    if (context.value < other) == context._determinant:
+        return
+    raise _unmet(context, "to be less than %(expected)s", hint, fail_message, other)
 
 
-@matcher
+@_register
 def to_be_less_than_or_equal_to(context, other, hint=None, fail_message=None):
     """Checks if `value <= other`.
 
@@ -343,17 +482,21 @@ def to_be_less_than_or_equal_to(context, other, hint=None, fail_message=None):
         Traceback (most recent call last):
             ...
         UnmetExpectation: Expected 9 to be less than or equal to 5
+
+    Supports negation via the `NOT` operator::
+
+        >>> expect(9).NOT.to_be_less_than_or_equal_to(5)
+        >>> expect(9).NOT.to_be_less_than_or_equal_to(9)
+        Traceback (most recent call last):
+            ...
+        UnmetExpectation: Expected 9 not to be less than or equal to 9
     """
-    if not fail_message:
-        if hint:
-            fail_message = "Expected %(hint)s to be less than or equal to %(expected)r but got %(actual)r"
-        else:
-            fail_message = "Expected %(actual)r to be less than or equal to %(expected)r"
-    message = fail_message % {'actual': context.value, 'expected': other, 'hint': hint}
-    ensure(context.value <= other, True, message)
+    if (context.value <= other) == context._determinant:
+        return
+    raise _unmet(context, "to be less than or equal to %(expected)s", hint, fail_message, other)
 
 
-@matcher
+@_register
 def to_be_greater_than(context, other, hint=None, fail_message=None):
     """Checks if `value > other`.
 
@@ -372,17 +515,21 @@ def to_be_greater_than(context, other, hint=None, fail_message=None):
         Traceback (most recent call last):
             ...
         UnmetExpectation: Expected 20 to be greater than 20
+
+    Supports negation via the `NOT` operator::
+
+        >>> expect(20).NOT.to_be_greater_than(30)
+        >>> expect(20).NOT.to_be_greater_than(10)
+        Traceback (most recent call last):
+            ...
+        UnmetExpectation: Expected 20 not to be greater than 10
     """
-    if not fail_message:
-        if hint:
-            fail_message = "Expected %(hint)s to be greater than %(expected)r but got %(actual)r"
-        else:
-            fail_message = "Expected %(actual)r to be greater than %(expected)r"
-    message = fail_message % {'actual': context.value, 'expected': other, 'hint': hint}
-    ensure(context.value > other, True, message)
+    if (context.value > other) == context._determinant:
+        return
+    raise _unmet(context, "to be greater than %(expected)s", hint, fail_message, other)
 
 
-@matcher
+@_register
 def to_be_greater_than_or_equal_to(context, other, hint=None, fail_message=None):
     """Checks if `value >= other`.
 
@@ -397,17 +544,21 @@ def to_be_greater_than_or_equal_to(context, other, hint=None, fail_message=None)
         Traceback (most recent call last):
             ...
         UnmetExpectation: Expected 20 to be greater than or equal to 30
+
+    Supports negation via the `NOT` operator::
+
+        >>> expect(20).NOT.to_be_greater_than_or_equal_to(30)
+        >>> expect(20).NOT.to_be_greater_than_or_equal_to(20)
+        Traceback (most recent call last):
+            ...
+        UnmetExpectation: Expected 20 not to be greater than or equal to 20
     """
-    if not fail_message:
-        if hint:
-            fail_message = "Expected %(hint)s to be greater than or equal to %(expected)r but got %(actual)r"
-        else:
-            fail_message = "Expected %(actual)r to be greater than or equal to %(expected)r"
-    message = fail_message % {'actual': context.value, 'expected': other, 'hint': hint}
-    ensure(context.value >= other, True, message)
+    if (context.value >= other) == context._determinant:
+        return
+    raise _unmet(context, "to be greater than or equal to %(expected)s", hint, fail_message, other)
 
 
-@matcher
+@_register
 def to_be_none(context, hint=None, fail_message=None):
     """Checks that the wrapped `value` is None.
 
@@ -423,17 +574,21 @@ def to_be_none(context, hint=None, fail_message=None):
         Traceback (most recent call last):
             ...
         UnmetExpectation: Expected 'This is not None' to be None
+
+    Supports negation via the `NOT` operator::
+
+        >>> expect('Something').NOT.to_be_none()
+        >>> expect(None).NOT.to_be_none()
+        Traceback (most recent call last):
+            ...
+        UnmetExpectation: Expected None not to be None
     """
-    if not fail_message:
-        if hint:
-            fail_message = "Expected %(hint)s to be None but got %(actual)r"
-        else:
-            fail_message = "Expected %(actual)r to be None"
-    message = fail_message % {'actual': context.value, 'hint': hint}
-    ensure(context.value is None, True, message)
+    if (context.value is None) is context._determinant:
+        return
+    raise _unmet(context, "to be None", hint, fail_message)
 
 
-@matcher
+@_register
 def to_be_truthy(context, hint=None, fail_message=None):
     """Evaluates the Python "truthiness" -- `bool()` of a given expression.
     See :meth:`to_be_falsy` for inverse matcher.
@@ -484,17 +639,21 @@ def to_be_truthy(context, hint=None, fail_message=None):
         Traceback (most recent call last):
             ...
         UnmetExpectation: Expected None to be truthy
+
+    Supports negation via the `NOT` operator::
+
+        >>> expect('').NOT.to_be_truthy()
+        >>> expect('Foo').NOT.to_be_truthy()
+        Traceback (most recent call last):
+            ...
+        UnmetExpectation: Expected 'Foo' not to be truthy
     """
-    if not fail_message:
-        if hint:
-            fail_message = "Expected %(hint)s to be truthy but got %(actual)r"
-        else:
-            fail_message = "Expected %(actual)r to be truthy"
-    message = fail_message % {'actual': context.value, 'hint': hint}
-    ensure(bool(context.value), True, message)
+    if (not context.value) is not context._determinant:
+        return
+    raise _unmet(context, "to be truthy", hint, fail_message)
 
 
-@matcher
+@_register
 def to_be_falsy(context, hint=None, fail_message=None):
     """Evaluates the Python "falsyness" -- `not bool()` of a given expression.
     See :meth:`to_be_truthy` for inverse matcher and details on Python truth tests.
@@ -528,17 +687,21 @@ def to_be_falsy(context, hint=None, fail_message=None):
         Traceback (most recent call last):
             ...
         UnmetExpectation: Expected True to be falsy
+
+    Supports negation via the `NOT` operator::
+
+        >>> expect('Foo').NOT.to_be_falsy()
+        >>> expect('').NOT.to_be_falsy()
+        Traceback (most recent call last):
+            ...
+        UnmetExpectation: Expected '' not to be falsy
     """
-    if not fail_message:
-        if hint:
-            fail_message = "Expected %(hint)s to be falsy but got %(actual)r"
-        else:
-            fail_message = "Expected %(actual)r to be falsy"
-    message = fail_message % {'actual': context.value, 'hint': hint}
-    ensure(not bool(context.value), True, message)
+    if (not context.value) is context._determinant:
+        return
+    raise _unmet(context, "to be falsy", hint, fail_message)
 
 
-@matcher
+@_register
 def to_contain(context, other, hint=None, fail_message=None):
     """Checks if the wrapped `value` contains the other value.
 
@@ -566,17 +729,195 @@ def to_contain(context, other, hint=None, fail_message=None):
 
         >>> pos = {'x': 40, 'y': 500}
         >>> expect(pos).to_contain('x')
+
+    Supports negation via the `NOT` operator::
+
+        >>> expect(['dog', 'cat']).NOT.to_contain('fly')
+        >>> expect(['dog', 'cat']).NOT.to_contain('cat')
+        Traceback (most recent call last):
+            ...
+        UnmetExpectation: Expected ['dog', 'cat'] not to contain 'cat'
     """
-    if not fail_message:
-        if hint:
-            fail_message = "Expected %(hint)s to contain %(expected)r but got %(actual)r"
-        else:
-            fail_message = "Expected %(actual)r to contain %(expected)r"
-    message = fail_message % {'actual': context.value, 'expected': other, 'hint': hint}
-    ensure(other in context.value, True, message)
+    if (other in context.value) is context._determinant:
+        return
+    raise _unmet(context, "to contain %(expected)s", hint, fail_message, other)
+
+
+@_register
+def to_contain_any(context, others, hint=None, fail_message=None):
+    """Checks if the wrapped `value` contains at least one of the `others`.
+
+    The search stops at the first item found. Containment is tested with `in`, so
+    wrapping a large list in a `set` or `frozenset` once, before checking it
+    repeatedly, turns each lookup into a single hash probe.
+
+    Passes if any of the other values is in the wrapped value::
+
+        >>> fruits = frozenset(['apple', 'orange', 'pear'])
+        >>> expect(fruits).to_contain_any(['kiwi', 'pear'])
+
+    Fails if none of them can be found::
+
+        >>> mammals = ['dog', 'whale', 'cat']
+        >>> expect(mammals).to_contain_any(['fly', 'ant'])
+        Traceback (most recent call last):
+            ...
+        UnmetExpectation: Expected ['dog', 'whale', 'cat'] to contain any of ['fly', 'ant']
+
+    Supports negation via the `NOT` operator::
+
+        >>> expect(['dog', 'cat']).NOT.to_contain_any(['fly', 'ant'])
+        >>> expect(['dog', 'cat']).NOT.to_contain_any(['fly', 'cat'])
+        Traceback (most recent call last):
+            ...
+        UnmetExpectation: Expected ['dog', 'cat'] not to contain any of ['fly', 'cat']
+    """
+    value = context.value
+    if any(other in value for other in others) is context._determinant:
+        return
+    raise _unmet(context, "to contain any of %(expected)s", hint, fail_message, others)
 
 
-@matcher
+def _mismatches(same, actual, others, limit=5):
+    """Lists the first *limit* positions where the pairwise check *same* fails
+    (or where one of the sequences has no counterpart), for a failure message.
+    """
+    indices = [i for i, (a, b) in enumerate(zip(actual, others)) if not same(a, b)]
+    indices.extend(range(min(len(actual), len(others)), max(len(actual), len(others))))
+    shown = ", ".join(map(str, indices[:limit]))
+    return shown + ", ..." if len(indices) > limit else shown
+
+
+def _check_all(context, same, others, phrase, hint=None, fail_message=None):
+    """Applies the pairwise check *same* to the items of the wrapped `value` and
+    *others*, for the matchers that compare two sequences item by item. Raises
+    the error from :func:`_unmet` unless the sequences have the same length and
+    every pair passes.
+
+    Both operands are read into lists first, so that iterators are consumed
+    only once; the message shows those lists. When the expectation is not
+    negated, the message also lists the positions where the sequences differ;
+    they are available to *fail_message* as ``%(indices)s``.
+    """
+    actual = list(context.value)
+    expected = list(others)
+    same_all = len(actual) == len(expected) and all(same(a, b) for a, b in zip(actual, expected))
+    if same_all is context._determinant:
+        return
+    indices = ""
+    if context._determinant:
+        indices = _mismatches(same, actual, expected)
+        phrase += " (mismatch at index %(indices)s)"
+    raise _unmet(context, phrase, hint, fail_message, expected, actual=actual, indices=indices)
+
+
+@_register
+def to_equal_all(context, others, hint=None, fail_message=None):
+    """Checks if every item in the wrapped `value` equals the item at the same
+    position in `others`.
+
+    The comparison runs over both sequences in a single pass, so a whole batch of
+    values (a list, a tuple, an array...) is verified in one expectation rather
+    than one expectation per item.
+
+    Passes if the sequences hold equal items in the same order::
+
+        >>> expect([1, 2, 3]).to_equal_all((1, 2, 3))
+
+    Fails if any of the items differ, and reports where::
+
+        >>> expect([1, 2, 3, 4]).to_equal_all([1, 5, 3, 0])
+        Traceback (most recent call last):
+            ...
+        UnmetExpectation: Expected [1, 2, 3, 4] to equal [1, 5, 3, 0] item by item (mismatch at index 1, 3)
+
+    Items without a counterpart count as differences::
+
+        >>> expect([1, 2]).to_equal_all([1, 2, 3], hint='totals')
+        Traceback (most recent call last):
+            ...
+        UnmetExpectation: Expected totals to equal [1, 2, 3] item by item (mismatch at index 2) but got [1, 2]
+
+    Any iterable may be compared, generators included::
+
+        >>> expect([1, 3]).to_equal_all(n for n in [1, 2])
+        Traceback (most recent call last):
+            ...
+        UnmetExpectation: Expected [1, 3] to equal [1, 2] item by item (mismatch at index 1)
+
+    Like :meth:`to_equal`, an item is always equal to itself::
+
+        >>> nan = float('nan')
+        >>> expect([1.0, nan]).to_equal_all([1.0, nan])
+
+    Supports negation via the `NOT` operator::
+
+        >>> expect([1, 2]).NOT.to_equal_all([1, 3])
+        >>> expect([1, 2]).NOT.to_equal_all((1, 2))
+        Traceback (most recent call last):
+            ...
+        UnmetExpectation: Expected [1, 2] not to equal [1, 2] item by item
+        >>> expect([1, 2]).NOT.to_equal_all([1, 2], hint='totals')
+        Traceback (most recent call last):
+            ...
+        UnmetExpectation: Expected totals not to equal [1, 2] item by item but got [1, 2]
+    """
+    def equal(a, b):
+        return a is b or a == b
+
+    _check_all(context, equal, others, "to equal %(expected)s item by item", hint, fail_message)
+
+
+@_register
+def to_be_close_all(context, others, rtol=1e-05, atol=1e-08, hint=None, fail_message=None):
+    """Checks if every number in the wrapped `value` is close to the number at the
+    same position in `others`, i.e. equal to it or within `atol + rtol * abs(other)` of it.
+
+    - *rtol* is the tolerance relative to the magnitude of each item in `others`.
+    - *atol* is the absolute tolerance, which matters most for items close to zero.
+
+    Passes if every pair of numbers is within tolerance::
+
+        >>> expect([0.1 + 0.2, 1.0]).to_be_close_all([0.3, 1.0])
+
+    Fails if any pair is too far apart, and reports where::
+
+        >>> expect([1.0, 2.5]).to_be_close_all([1.0, 2.0])
+        Traceback (most recent call last):
+            ...
+        UnmetExpectation: Expected [1.0, 2.5] to be close to [1.0, 2.0] item by item (mismatch at index 1)
+
+    Numbers without a counterpart count as differences::
+
+        >>> expect([1.0, 2.0]).to_be_close_all([1.0, 2.0, 3.0])
+        Traceback (most recent call last):
+            ...
+        UnmetExpectation: Expected [1.0, 2.0] to be close to [1.0, 2.0, 3.0] item by item (mismatch at index 2)
+
+    The tolerances may be widened to suit the data::
+
+        >>> expect([1.0, 2.5]).to_be_close_all([1.0, 2.0], atol=0.5)
+
+    Equal numbers are always close, infinities included::
+
+        >>> inf = float('inf')
+        >>> expect([inf, -inf]).to_be_close_all([inf, -inf])
+
+    Supports negation via the `NOT` operator::
+
+        >>> expect([1.0, 2.5]).NOT.to_be_close_all([1.0, 2.0])
+        >>> expect([1.0, 2.5]).NOT.to_be_close_all([1.0, 2.5])
+        Traceback (most recent call last):
+            ...
+        UnmetExpectation: Expected [1.0, 2.5] not to be close to [1.0, 2.5] item by item
+    """
+    def close(a, b):
+        return a == b or abs(a - b) <= atol + rtol * abs(b)
+
+    _check_all(context, close, others, "to be close to %(expected)s item by item", hint, fail_message)
+
+
+@_register
 def to_return(context, expected):
     """Compares the return value of the wrapped callable to the expected value
 
@@ -611,13 +952,27 @@ def to_return(context, expected):
         >>> expect(baz, "please").to_return('Baz please change me')
         >>> expect(baz, "params", b="got", c="changed!").to_return('Baz params got changed!')
 
+    Supports negation via the `NOT` operator::
+
+        >>> expect(foo).NOT.to_return('Bar')
+        >>> expect(foo).NOT.to_return('Foo')
+        Traceback (most recent call last):
+            ...
+        UnmetExpectation: Expected callable not to return 'Foo' but got 'Foo'
     """
     actual = context.value(*context.args, **context.kwargs)
-    message = "Expected callable to return %r but got %r" % (expected, actual)
-    ensure(actual == expected, True, message)
+    if (actual == expected) == context._determinant:
+        return
+    negate = _NEGATE[context._determinant]
+    raise UnmetExpectation("Expected callable %sto return %s but got %s" % (negate, _r(expected), _r(actual)))
 
 
-@matcher
+def _exception_repr(cls, args):
+    """Describes an exception as ``Name('arg', ...)``, the same way on every Python version."""
+    return "%s(%s)" % (cls.__name__, ", ".join(map(_r, args)))
+
+
+@_register
 def to_raise(context, exception_class=None, exception_message=None):
     """Invokes the provided callable and ensures that it raises an Exception.
 
@@ -650,8 +1005,13 @@ def to_raise(context, exception_class=None, exception_message=None):
         >>> expect(raise_custom_exception).to_raise(CatastrophicError)
         Traceback (most recent call last):
             ...
-        UnmetExpectation: Expected callable to raise CatastrophicError() 
+        UnmetExpectation: Expected callable to raise CatastrophicError()
           but got MildError()
+        >>> expect(good).to_raise(CatastrophicError)
+        Traceback (most recent call last):
+            ...
+        UnmetExpectation: Expected callable to raise CatastrophicError()
+          but got None
 
     Further, you may specify the message you expect the exception to be raised with.
     The expectation will fail if the callable raises the right exception but with
@@ -659,38 +1019,62 @@ def to_raise(context, exception_class=None, exception_message=None):
 
         >>> def raise_exception_with_message():
         ...     raise CatastrophicError('BOOM!')
+        >>> expect(raise_exception_with_message).to_raise(CatastrophicError, 'BOOM!')
         >>> expect(raise_exception_with_message).to_raise(CatastrophicError, 'Ohly Crap...',)
         Traceback (most recent call last):
             ...
-        UnmetExpectation: Expected callable to raise CatastrophicError('Ohly Crap...',) 
-          but got CatastrophicError('BOOM!',)
-    """
-    raised = False
-    actual_exception = None
+        UnmetExpectation: Expected callable to raise CatastrophicError('Ohly Crap...')
+          but got CatastrophicError('BOOM!')
+
+    The message is matched against the argument the exception was raised with,
+    so exceptions whose text is quoted, like KeyError, match too::
+
+        >>> expect(lambda: {}['x']).to_raise(KeyError, 'x')
 
+    Supports negation via the `NOT` operator::
+
+        >>> expect(good).NOT.to_raise()
+        >>> expect(raise_custom_exception).NOT.to_raise(CatastrophicError)
+        >>> expect(raise_custom_exception).NOT.to_raise(MildError)
+        Traceback (most recent call last):
+            ...
+        UnmetExpectation: Expected callable not to raise MildError()
+    """
     try:
         context.value(*context.args, **context.kwargs)
+    except (exception_class or Exception) as e:
+        if not (exception_class and exception_message) or e.args == (exception_message,) \
+                or str(e) == exception_message:
+            if context._determinant:
+                return
+            raise UnmetExpectation("Expected callable not to raise %s" % _exception_repr(type(e), e.args))
+        actual_exception = e
     except Exception as e:
         actual_exception = e
-        raised = True
-
-    if exception_class and exception_message:
-        message = "Expected callable to raise %r \n  but got %r" % (exception_class(exception_message), actual_exception)
-        ensure(raised and isinstance(actual_exception, exception_class) and actual_exception.message == exception_message, True, message)
-    elif exception_class:
-        message = "Expected callable to raise %r \n  but got %r" % (exception_class(), actual_exception)
-        ensure(raised and isinstance(actual_exception, exception_class), True, message)
     else:
-        message = "Expected callable to raise an exception"
-        ensure(raised, True, message)
+        actual_exception = None
+
+    if not context._determinant:
+        return
+    if not exception_class:
+        raise UnmetExpectation("Expected callable to raise an exception")
+    expected = _exception_repr(exception_class, (exception_message,) if exception_message else ())
+    if actual_exception is None:
+        actual = _r(None)
+    else:
+        actual = _exception_repr(type(actual_exception), actual_exception.args)
+    raise UnmetExpectation("Expected callable to raise %s\n  but got %s" % (expected, actual))
 
 
 # Rich Comparison Matchers
 # ========================
 # These are convenient matchers that harness the Python "rich comparison"
 # methods to provide alternatives to some of the more verbose the base matchers.
+# They perform the comparison themselves rather than dispatching to the
+# equivalent base matcher, which saves a lookup and a call per expectation,
+# and share its failure message through _unmet().
 
-@matcher
+@_register
 def __eq__(context, other):
     """Checks if `value == other`. It is an alternative to the to_equal base matcher.
     For instance, this example::
@@ -707,11 +1091,22 @@ def __eq__(context, other):
         Traceback (most recent call last):
             ...
         UnmetExpectation: Expected 'waiting...' to equal 'done!'
+
+    Supports negation via the `NOT` operator::
+
+        >>> expect('waiting...').NOT == 'done!'
+        >>> expect('waiting...').NOT == 'waiting...'
+        Traceback (most recent call last):
+            ...
+        UnmetExpectation: Expected 'waiting...' not to equal 'waiting...'
     """
-    context.to_equal(other)
+    value = context.value
+    if (value is other or value == other) == context._determinant:
+        return
+    raise _unmet(context, "to equal %(expected)s", expected=other)
 
 
-@matcher
+@_register
 def __lt__(context, other):
     """Checks if `value < other`. It is an alternative to the to_be_less_than base matcher.
     For instance, this example::
@@ -729,10 +1124,12 @@ def __lt__(context, other):
             ...
         UnmetExpectation: Expected 350 to be less than 200
     """
-    context.to_be_less_than(other)
+    if (context.value < other) == context._determinant:
+        return
+    raise _unmet(context, "to be less than %(expected)s", expected=other)
 
 
-@matcher
+@_register
 def __le__(context, other):
     """Checks if `value <= other`. It is an alternative to the
     to_be_less_than_or_equal_to base matcher. For instance, this example::
@@ -750,10 +1147,12 @@ def __le__(context, other):
             ...
         UnmetExpectation: Expected 201 to be less than or equal to 200
     """
-    context.to_be_less_than_or_equal_to(other)
+    if (context.value <= other) == context._determinant:
+        return
+    raise _unmet(context, "to be less than or equal to %(expected)s", expected=other)
 
 
-@matcher
+@_register
 def __gt__(context, other):
     """Checks if `value > other`. It is an alternative to the to_be_greater_than base matcher.
     For instance, this example::
@@ -771,10 +1170,12 @@ def __gt__(context, other):
             ...
         UnmetExpectation: Expected 150 to be greater than 200
     """
-    context.to_be_greater_than(other)
+    if (context.value > other) == context._determinant:
+        return
+    raise _unmet(context, "to be greater than %(expected)s", expected=other)
 
 
-@matcher
+@_register
 def __ge__(context, other):
     """Checks if `value >= other`. It is an alternative to the
     to_be_greater_than_or_equal_to base matcher. For instance, this example::
@@ -792,4 +1193,100 @@ def __ge__(context, other):
             ...
         UnmetExpectation: Expected 199 to be greater than or equal to 200
     """
-    context.to_be_greater_than_or_equal_to(other)
+    if (context.value >= other) == context._determinant:
+        return
+    raise _unmet(context, "to be greater than or equal to %(expected)s", expected=other)
+
+
+# Shortcuts
+# =========
+# Plain functions for the most common comparisons. They skip creating an
+# expectation altogether, which makes them the cheapest way to verify values
+# in tight loops; the failure messages match the equivalent base matchers.
+
+def expect_eq(actual, expected):
+    """Checks if `actual == expected`. A shortcut for `expect(actual).to_equal(expected)`::
+
+        >>> expect_eq(555, 555)
+        >>> expect_eq('waiting...', 'done!')
+        Traceback (most recent call last):
+            ...
+        UnmetExpectation: Expected 'waiting...' to equal 'done!'
+    """
+    if actual is expected or actual == expected:
+        return
+    raise UnmetExpectation("Expected %s to equal %s" % (_r(actual), _r(expected)))
+
+
+def expect_is(actual, expected):
+    """Checks if `actual is expected`. A shortcut for `expect(actual).to_be(expected)`::
+
+        >>> a1 = a2 = ['foo', 'bar']
+        >>> expect_is(a1, a2)
+        >>> expect_is(a1, ['foo', 'bar'])
+        Traceback (most recent call last):
+            ...
+        UnmetExpectation: Expected ['foo', 'bar'] to be ['foo', 'bar']
+    """
+    if actual is expected:
+        return
+    raise UnmetExpectation("Expected %s to be %s" % (_r(actual), _r(expected)))
+
+
+def expect_lt(actual, expected):
+    """Checks if `actual < expected`. A shortcut for `expect(actual).to_be_less_than(expected)`::
+
+        >>> expect_lt(9, 10)
+        >>> expect_lt(9, 9)
+        Traceback (most recent call last):
+            ...
+        UnmetExpectation: Expected 9 to be less than 9
+    """
+    if actual < expected:
+        return
+    raise UnmetExpectation("Expected %s to be less than %s" % (_r(actual), _r(expected)))
+
+
+def expect_le(actual, expected):
+    """Checks if `actual <= expected`. A shortcut for `expect(actual).to_be_less_than_or_equal_to(expected)`::
+
+        >>> expect_le(9, 9)
+        >>> expect_le(9, 5)
+        Traceback (most recent call last):
+            ...
+        UnmetExpectation: Expected 9 to be less than or equal to 5
+    """
+    if actual <= expected:
+        return
+    raise UnmetExpectation("Expected %s to be less than or equal to %s" % (_r(actual), _r(expected)))
+
+
+def expect_gt(actual, expected):
+    """Checks if `actual > expected`. A shortcut for `expect(actual).to_be_greater_than(expected)`::
+
+        >>> expect_gt(20, 10)
+        >>> expect_gt(20, 20)
+        Traceback (most recent call last):
+            ...
+        UnmetExpectation: Expected 20 to be greater than 20
+    """
+    if actual > expected:
+        return
+    raise UnmetExpectation("Expected %s to be greater than %s" % (_r(actual), _r(expected)))
+
+
+def expect_ge(actual, expected):
+    """Checks if `actual >= expected`. A shortcut for `expect(actual).to_be_greater_than_or_equal_to(expected)`::
+
+        >>> expect_ge(20, 20)
+        >>> expect_ge(20, 30)
+        Traceback (most recent call last):
+            ...
+        UnmetExpectation: Expected 20 to be greater than or equal to 30
+    """
+    if actual >= expected:
+        return
+    raise UnmetExpectation("Expected %s to be greater than or equal to %s" % (_r(actual), _r(expected)))
+
+
+_install(Expr, _MATCHERS)
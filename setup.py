@@ -1,10 +1,17 @@
 import os
+from io import open
 from setuptools import setup
 
+
+def read(name):
+    with open(os.path.join(os.path.dirname(__file__), name), encoding='utf-8') as f:
+        return f.read()
+
+
 version = '0.3dev'
 long_description = '\n\n'.join([
-    open('README.rst').read(),
-    open('CHANGES.txt').read(),
+    read('README.rst'),
+    read('CHANGES.txt'),
 ])
 
 setup(